@@ -3,18 +3,128 @@ See more at the official Cloudflare Stream docs:
 https://api.cloudflare.com/#stream-videos-properties
 """
 
+from __future__ import annotations
+
+import asyncio
+import base64
+import orjson
 import requests
 import time
 
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import jwt
+    from cryptography.hazmat.primitives import serialization
+except ImportError:
+    jwt = None
+
+
+# The hosts this client talks to. Each gets a tuned connection pool and retry policy.
+API_HOST = "https://api.cloudflare.com"
+SIGN_HOST = "https://util.cloudflarestream.com"
+
+# Signing keys endpoint for an account ID. Used by both create_signing_keys() and list_signing_keys().
+KEYS_URL_TMPL = "https://api.cloudflare.com/client/v4/accounts/{}/stream/keys"
+
+# (connect, read) timeouts in seconds. Connect is just over TCP's 3 second SYN retransmit window.
+DEFAULT_TIMEOUT = (3.05, 27)
+POLL_READ_TIMEOUT = 10
+
+# How long to trust your plan's total storage minutes before asking Cloudflare again, in seconds.
+STORAGE_LIMIT_TTL = 60 * 60
+
+
+def _retry(methods: tuple) -> Retry:
+    """
+    Retries with exponential backoff on connection resets and transient 429/5xx responses from Cloudflare.
+    Read errors and bad statuses are only retried for `methods`. Connect errors are always retried,
+    since the request never reached Cloudflare.
+    """
+    return Retry(
+        total=5,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(methods),
+        raise_on_status=False,  # Hand the last response back to the caller instead of raising
+    )
+
+
+def _mount_adapters(session: requests.Session, retry_posts: bool=False) -> requests.Session:
+    """
+    Mount a larger connection pool with retries on a session.
+
+    POSTs to the API are not retried by default: a POST that timed out or 5xx'd may still have been
+    carried out, and repeating /stream/copy pulls the same video twice while repeating /stream/keys
+    creates another signing key. Pass retry_posts=True only for sessions that send POSTs which are safe
+    to repeat, like /token and /downloads. Signing on util.cloudflarestream.com is always safe to repeat.
+    """
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=_retry(("GET", "DELETE")))
+    repeatable = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=_retry(("GET", "DELETE", "POST")))
+    session.mount(API_HOST, repeatable if retry_posts else adapter)
+    session.mount(SIGN_HOST, repeatable)
+    return session
+
+
+# Shared by the classmethods, which have no client (and no client session) to use.
+_MODULE_SESSION = _mount_adapters(requests.Session())
+
+
+def _poll_delays(initial: float=1.0, factor: float=1.7, maximum: float=10.0, timeout: float=300.0):
+    """
+    Yields how long to sleep between polls: exponential backoff capped at `maximum` seconds,
+    until roughly `timeout` seconds of sleeping have been handed out.
+    """
+    delay, waited = initial, 0.0
+    while waited < timeout:
+        yield delay
+        waited += delay
+        delay = min(delay * factor, maximum)
+
+
+def _decode(response: requests.Response):
+    """
+    Decode a JSON response body with orjson, which is a good deal faster than response.json().
+    """
+    return orjson.loads(response.content)
+
+
+def _aiohttp_timeout(timeout: tuple | None) -> aiohttp.ClientTimeout:
+    """
+    Translate a requests-style (connect, read) timeout for aiohttp. None disables the timeout.
+    """
+    if timeout is None:
+        return aiohttp.ClientTimeout(total=None)
+    return aiohttp.ClientTimeout(sock_connect=timeout[0], sock_read=timeout[1])
+
 
 class StreamClient:
 
-    def __init__(self, auth_email: str=None, auth_api_key: str=None, account_id: str=None, pem: str=None, signing_token: str=None) -> None:
+    def __init__(self, auth_email: str=None, auth_api_key: str=None, account_id: str=None, pem: str=None, signing_token: str=None, timeout: tuple | float | None=DEFAULT_TIMEOUT) -> None:
         self.AUTH_EMAIL = auth_email
         self.AUTH_API_KEY = auth_api_key
         self.ACCOUNT_ID = account_id
         self.PEM = pem
         self.SIGNING_TOKEN = signing_token
+        self._private_key = (None, None)  # (pem, parsed key), parsed on first use by get_signed_url_local()
+
+        # Account-scoped endpoints, built once instead of on every call.
+        self._base = f"https://api.cloudflare.com/client/v4/accounts/{account_id}/stream"
+        self._keys_url = KEYS_URL_TMPL.format(account_id)
+        self._storage_url = f"{self._base}/storage-usage"
 
         # The standard request headers, minus the pem.
         self._request_headers = {
@@ -23,6 +133,77 @@ class StreamClient:
             "Content-Type": "application/json",
         }
 
+        # One session for the lifetime of the client so connections to Cloudflare are kept alive and reused.
+        self._session = _mount_adapters(requests.Session())
+        self._session.headers.update(self._request_headers)
+        # A second session that also retries POSTs, for the download token and status requests which are safe to repeat.
+        self._repeatable_session = _mount_adapters(requests.Session(), retry_posts=True)
+        self._repeatable_session.headers.update(self._request_headers)
+        # The aiohttp session for the *_async methods. It belongs to the event loop it was created on, and is
+        # closed when the last async call finishes, unless it's held open by `async with client`.
+        self._async_session = None
+        self._async_session_loop = None
+        self._async_calls = 0
+        self._async_held = False
+
+        # (connect, read) seconds so a stalled connection fails and gets retried instead of hanging forever.
+        # A single number is used for both, like in requests. None waits forever.
+        # Download polls get an answer quickly, so they use a shorter read timeout.
+        if timeout is None:
+            self._timeout = self._poll_timeout = None
+        else:
+            timeout = tuple(timeout) if isinstance(timeout, (tuple, list)) else (timeout, timeout)
+            self._timeout = timeout
+            self._poll_timeout = (timeout[0], min(timeout[1], POLL_READ_TIMEOUT))
+
+        # (expires_at, value) pairs for the storage-usage endpoint. See _get_storage_usage()
+        self._storage_cache = (0.0, None)
+        self._storage_limit_cache = (0.0, None)
+
+    def __enter__(self) -> "StreamClient":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "StreamClient":
+        self._async_held = True  # Keep the aiohttp session open between async calls until __aexit__
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
+
+    def close(self) -> None:
+        """
+        Close the underlying HTTP session and any pooled connections.
+        If you used `async with client` or are mid-way through an async call, use `await client.aclose()` instead,
+        since the aiohttp session can only be closed from its event loop.
+
+        Usage:
+        with StreamClient(...) as client:
+            client.get_video('your-video-uid')
+        """
+        session = self._async_session
+        if session is not None and not session.closed:
+            if not self._async_session_loop.is_closed():
+                raise RuntimeError("An aiohttp session is still open. Use `await client.aclose()` or `async with client`.")
+            # Its event loop is gone, so there's nothing left to await. Just let go of it.
+            session.detach()
+        self._async_session = self._async_session_loop = None
+
+        self._session.close()
+        self._repeatable_session.close()
+
+    async def aclose(self) -> None:
+        """
+        Close both the HTTP session and the aiohttp session used by the *_async methods.
+        Required (or use `async with client`) once you've held the client open for async calls.
+        """
+        self._async_held = False
+        if self._async_session is not None and self._async_session_loop is asyncio.get_running_loop():
+            await self._async_session.close()
+        self.close()
+
     @classmethod
     def create_signing_keys(cls, account_id, account_email, cloudflare_api_key) -> dict:
         """
@@ -38,13 +219,13 @@ class StreamClient:
         Usage:
         keys = StreamClient.create_signing_keys('youraccountidhere')
         """
-        url = f"https://api.cloudflare.com/client/v4/accounts/{account_id}/stream/keys"
-        response = requests.post(url, headers={
+        url = KEYS_URL_TMPL.format(account_id)
+        response = _MODULE_SESSION.post(url, headers={
             "X-Auth-Email": account_email,
             "X-Auth-Key": cloudflare_api_key,
             "Content-Type": "application/json",
-        })
-        data = response.json()
+        }, timeout=DEFAULT_TIMEOUT)
+        data = _decode(response)
         return data
 
     def delete_video(self, cloudflare_video_uid: str) -> int:
@@ -55,20 +236,30 @@ class StreamClient:
             :returns                    int         Returns the request's status code.
                                                     Returns 200 is the video was deleted.
         """
-        url = f"https://api.cloudflare.com/client/v4/accounts/{self.ACCOUNT_ID}/stream/{cloudflare_video_uid}/"
-        res = requests.delete(url, headers=self._request_headers)  # noqa
+        url = f"{self._base}/{cloudflare_video_uid}/"
+        res = self._session.delete(url, timeout=self._timeout)
         return res.status_code
 
+    def delete_videos(self, cloudflare_video_uids: list, max_workers: int=16) -> list:
+        """
+        Delete many videos at once. Cloudflare has no batch endpoint, so this runs delete_video() in parallel.
+            :cloudflare_video_uids      list        The Video UUIDs provided by Cloudflare
+            :max_workers                int         Default: 16. How many requests to make at the same time.
+                                                    Lower this if you're running into Cloudflare's rate limits.
+            :returns                    list        The status code for each video, in the same order.
+        """
+        return self._fan_out(self.delete_video, cloudflare_video_uids, max_workers)
+
     def get_total_storage_minutes(self) -> int:
         """
         Gets the total number of minutes available in your CloudFlare Stream plan.
             :returns                    int         Returns an int representing the total
                                                     minutes allotted in your account
         """
-        url = f'https://api.cloudflare.com/client/v4/accounts/{self.ACCOUNT_ID}/stream/storage-usage'
-        res = requests.get(url, headers=self._request_headers)
-        data = res.json()
-        return int(data['result']['totalStorageMinutesLimit'] )
+        limit_expires_at, limit = self._storage_limit_cache
+        if time.time() < limit_expires_at:
+            return limit
+        return int(self._get_storage_usage()['totalStorageMinutesLimit'])
 
     def get_remaining_cloudflare_minutes(self) -> int:
         """
@@ -76,21 +267,54 @@ class StreamClient:
             :returns                    int         Returns an int representing the total
                                                     minutes remaining in your account
         """
-        url = f'https://api.cloudflare.com/client/v4/accounts/{self.ACCOUNT_ID}/stream/storage-usage'
-        res = requests.get(url, headers=self._request_headers)
-        data = res.json()
-        total_remaining = data['result']['totalStorageMinutesLimit'] - data['result']['totalStorageMinutes']
+        usage = self._get_storage_usage()
+        total_remaining = usage['totalStorageMinutesLimit'] - usage['totalStorageMinutes']
         return int(total_remaining)
 
+    def _get_storage_usage(self, ttl: int=30) -> dict:
+        """
+        Fetch the `storage-usage` result, reusing the last one for `ttl` seconds.
+        Your plan's minute limit hardly ever changes, so it's kept for an hour on its own.
+        """
+        expires_at, usage = self._storage_cache
+        if time.time() < expires_at:
+            return usage
+
+        res = self._session.get(self._storage_url, timeout=self._timeout)
+        usage = _decode(res)['result']
+        if res.status_code != 200:
+            return usage  # Don't hold on to errors
+
+        now = time.time()
+        self._storage_cache = (now + ttl, usage)
+        self._storage_limit_cache = (now + STORAGE_LIMIT_TTL, int(usage['totalStorageMinutesLimit']))
+        return usage
+
     def get_video(self, cloudflare_video_uid: str) -> dict:
         """
         Return JSON data from CloudFlare Stream about a particular video.
             :cloudflare_video_uid       str         The Video UUID provided by Cloudflare
             :return                     dict        Returns a dictionary with all the video data.
         """
-        url = f"https://api.cloudflare.com/client/v4/accounts/{self.ACCOUNT_ID}/stream/{cloudflare_video_uid}/"
-        res = requests.get(url, headers=self._request_headers)
-        return res.json()
+        url = f"{self._base}/{cloudflare_video_uid}/"
+        res = self._session.get(url, timeout=self._timeout)
+        return _decode(res)
+
+    def get_videos(self, cloudflare_video_uids: list, max_workers: int=16) -> list:
+        """
+        Return JSON data from CloudFlare Stream about many videos, fetched in parallel.
+            :cloudflare_video_uids      list        The Video UUIDs provided by Cloudflare
+            :max_workers                int         Default: 16. How many requests to make at the same time.
+            :return                     list        A dictionary of video data for each video, in the same order.
+        """
+        return self._fan_out(self.get_video, cloudflare_video_uids, max_workers)
+
+    def _fan_out(self, func, items, max_workers: int) -> list:
+        """
+        Call `func` on every item from a thread pool. The threads share this client's session and connection pool.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(func, items))
 
     def pull_from_url(self, url: str, video_title: str, require_signed_url: bool=False, watermark_uid: str=None) -> tuple:
         """
@@ -113,20 +337,17 @@ class StreamClient:
             "meta": {
                 "name": video_title,
             },
-            # "watermark": {
-            #     "uid": "07ed42591c7cfdd630bf7a158c5fb1b0"
-            # }
         }
 
         if watermark_uid:
-            payload['watermark']['uid'] = watermark_uid
+            payload["watermark"] = {"uid": watermark_uid}
 
-        response = requests.post(
-            f"https://api.cloudflare.com/client/v4/accounts/{self.ACCOUNT_ID}/stream/copy",
-            json=payload,
-            headers=self._request_headers,
+        response = self._session.post(
+            f"{self._base}/copy",
+            data=orjson.dumps(payload),
+            timeout=self._timeout,
         )
-        response_json = response.json()
+        response_json = _decode(response)
         return (response_json["result"]["uid"], response_json,)
 
     def get_download_url(self, cloudflare_video_uid, wait_until_ready: bool=False) -> str:
@@ -147,41 +368,106 @@ class StreamClient:
                                                     seconds, then it will return None. But with 55,000+ videos, we've
                                                     never seen it take longer than that.
         """
-        data = {
+        video_url = f"{self._base}/{cloudflare_video_uid}"
+        res = self._repeatable_session.post(f"{video_url}/token", data=orjson.dumps(self._download_token_payload()), timeout=self._timeout)
+
+        token = _decode(res)['result']['token']
+        download_url = f'https://videodelivery.net/{token}/downloads/default.mp4'
+        status_url = f"{video_url}/downloads"
+        body = orjson.dumps({"authorization": f"Bearer {token}"})  # The same for every poll
+
+        for delay in _poll_delays():
+            # Wait for a video's download URL to be generated by Cloudflare, backing off between checks
+            response = self._repeatable_session.post(
+                status_url,
+                data=body,
+                timeout=self._poll_timeout,
+            )
+
+            if not wait_until_ready:
+                # If you don't wait until the video is ready to be downloaded...
+                # This can be useful if you're storing the URL for later use.
+                return download_url
+
+            # Fail right away on an error instead of polling it until we time out.
+            response.raise_for_status()
+            # Most polls aren't ready yet, and those don't need to be parsed at all.
+            if b'"ready"' in response.content and _decode(response)['result']['default']['status'] == 'ready':
+                return download_url
+            time.sleep(delay)
+
+    async def get_download_url_async(self, cloudflare_video_uid, wait_until_ready: bool=False) -> str:
+        """
+        The same as get_download_url() but non-blocking, so you can wait on many videos at once.
+        Requires aiohttp: pip install python-cloudflare-stream[async]
+
+            :cloudflare_video_uid       str         The Video UUID provided by Cloudflare
+            :wait_until_ready           bool        Default: False. Wait until the video is done processing before
+                                                    returning the URL.
+            :returns                    str         Returns the URL of the download link, or None after 300 seconds.
+
+        Usage:
+        urls = await asyncio.gather(*[client.get_download_url_async(uid, wait_until_ready=True) for uid in uids])
+        """
+        async with self._async_session_scope() as session:
+            video_url = f"{self._base}/{cloudflare_video_uid}"
+            async with session.post(f"{video_url}/token", data=orjson.dumps(self._download_token_payload())) as res:
+                token = orjson.loads(await res.read())['result']['token']
+            download_url = f'https://videodelivery.net/{token}/downloads/default.mp4'
+            status_url = f"{video_url}/downloads"
+            body = orjson.dumps({"authorization": f"Bearer {token}"})
+
+            for delay in _poll_delays():
+                async with session.post(
+                    status_url,
+                    data=body,
+                    timeout=_aiohttp_timeout(self._poll_timeout),
+                ) as response:
+                    if not wait_until_ready:
+                        return download_url
+                    response.raise_for_status()
+                    content = await response.read()
+
+                if b'"ready"' in content and orjson.loads(content)['result']['default']['status'] == 'ready':
+                    return download_url
+                await asyncio.sleep(delay)
+
+    def _download_token_payload(self) -> dict:
+        return {
             "id": self.SIGNING_TOKEN,
             "pem": self.PEM,
             "exp": int(time.time()) + (60 * 60 * 24),  # Max 24 hours otherwise CloudFlare returns a 403 response
             "downloadable": True,
         }
-        url = f"https://api.cloudflare.com/client/v4/accounts/{self.ACCOUNT_ID}/stream/{cloudflare_video_uid}/token"
-        res = requests.post(url, json=data, headers=self._request_headers)
-
-        token = res.json()['result']['token']
-
-        for _ in range(30):
-            # 30x 10 second periods to wait for a video's download URL to be generated by Cloudflare
-            response = requests.post(
-                f"https://api.cloudflare.com/client/v4/accounts/{self.ACCOUNT_ID}/stream/{cloudflare_video_uid}/downloads",
-                headers=self._request_headers,
-                json={
-                    "authorization": f"Bearer {token}",
-                },
-            )
 
-            if not wait_until_ready:
-                # If you don't wait until the video is ready to be downloaded...
-                # This can be useful if you're storing the URL for later use.
-                return f'https://videodelivery.net/{token}/downloads/default.mp4'
+    @asynccontextmanager
+    async def _async_session_scope(self):
+        """
+        Hand out the aiohttp session for the running event loop, creating it if needed. Overlapping calls
+        (e.g. from asyncio.gather) share one session, and it's closed when the last of them finishes.
+        """
+        if aiohttp is None:
+            raise ImportError("aiohttp is required for async calls: pip install python-cloudflare-stream[async]")
 
-            response_json = response.json()
-            status = response_json['result']['default']['status']  # ie. `ready`
+        loop = asyncio.get_running_loop()
+        session = self._async_session
+        if session is None or session.closed or self._async_session_loop is not loop:
+            if session is not None and not session.closed and self._async_session_loop.is_closed():
+                session.detach()  # Left over from an event loop that's been shut down
+            session = self._async_session = aiohttp.ClientSession(
+                headers={key: value for key, value in self._request_headers.items() if value is not None},
+                timeout=_aiohttp_timeout(self._timeout),
+            )
+            self._async_session_loop = loop
 
-            if status == 'ready':
-                return f'https://videodelivery.net/{token}/downloads/default.mp4'
-            else:
-                # percent_complete = response_json['result']['default']['percentComplete']
-                # print(f"Not ready yet ({percent_complete}%).. waiting 10 seconds")
-                time.sleep(10)
+        self._async_calls += 1
+        try:
+            yield session
+        finally:
+            self._async_calls -= 1
+            if not self._async_calls and not self._async_held and self._async_session is session:
+                self._async_session = self._async_session_loop = None
+                await session.close()
 
     def get_signed_url(self, cloudflare_video_uid: str) -> str:
         """
@@ -195,13 +481,55 @@ class StreamClient:
             :return                     str         Returns the signed token whih should replace the cloudflare_video_uid
                                                     when attempting to stream a video.
         """
-        url = f"https://util.cloudflarestream.com/sign/{cloudflare_video_uid}"
-        data = {
-            "id": self.SIGNING_TOKEN,
-            "pem": self.PEM,
-            "exp": int(time.time() + (60 * 60)),
+        return self._sign(cloudflare_video_uid, int(time.time()) + (60 * 60))
+
+    def get_signed_urls(self, cloudflare_video_uids: list, max_workers: int=16) -> list:
+        """
+        Sign many videos in parallel, e.g. for a page full of players. Every token shares the same expiry.
+            :cloudflare_video_uids      list        The Video UUIDs provided by Cloudflare
+            :max_workers                int         Default: 16. How many requests to make at the same time.
+            :return                     list        The signed tokens, in the same order as the uids.
+        """
+        exp = int(time.time()) + (60 * 60)
+        return self._fan_out(lambda uid: self._sign(uid, exp), cloudflare_video_uids, max_workers)
+
+    def get_signed_url_local(self, cloudflare_video_uid: str, ttl: int=60 * 60) -> str:
+        """
+        The same as get_signed_url() but signs the token locally with your PEM key, without calling Cloudflare.
+        Requires PyJWT: pip install python-cloudflare-stream[jwt]
+
+            :cloudflare_video_uid       str         The Video UUID provided by Cloudflare
+            :ttl                        int         Default: 3600. How many seconds the signed token is valid for.
+            :return                     str         Returns the signed token whih should replace the cloudflare_video_uid
+                                                    when attempting to stream a video.
+        """
+        if jwt is None:
+            raise ImportError("PyJWT is required to sign locally: pip install python-cloudflare-stream[jwt]")
+
+        if not self.PEM:
+            raise ValueError("A PEM is required to sign locally. Pass pem= to StreamClient or set client.PEM.")
+
+        cached_pem, private_key = self._private_key
+        if cached_pem != self.PEM:
+            # Cloudflare hands out the PEM base64 encoded, but accept a plain PEM as well.
+            pem = self.PEM.encode()
+            if not pem.startswith(b"-----BEGIN"):
+                pem = base64.b64decode(pem)
+            private_key = serialization.load_pem_private_key(pem, password=None)
+            self._private_key = (self.PEM, private_key)
+
+        payload = {
+            "sub": cloudflare_video_uid,
+            "kid": self.SIGNING_TOKEN,
+            "exp": int(time.time()) + ttl,
         }
-        res = requests.post(url, json=data)
+        return jwt.encode(payload, private_key, algorithm="RS256", headers={"kid": self.SIGNING_TOKEN})
+
+    def _sign(self, cloudflare_video_uid: str, exp: int) -> str:
+        url = f"https://util.cloudflarestream.com/sign/{cloudflare_video_uid}"
+        data = {"id": self.SIGNING_TOKEN, "pem": self.PEM, "exp": exp}
+        # The signing endpoint doesn't need (or get) your Cloudflare credentials.
+        res = self._session.post(url, data=orjson.dumps(data), headers={"X-Auth-Email": None, "X-Auth-Key": None}, timeout=self._timeout)
         return res.text
 
     def get_all_videos(self) -> dict:
@@ -210,17 +538,37 @@ class StreamClient:
         The videos will be found in the response_json['result'] item.
         """
 
-        url = f"https://api.cloudflare.com/client/v4/accounts/{self.ACCOUNT_ID}/stream/"
-        response = requests.get(url, headers=self._request_headers)
-        response_json = response.json()
+        url = f"{self._base}/"
+        response = self._session.get(url, timeout=self._timeout)
+        response_json = _decode(response)
         return response_json
 
+    def iter_all_videos(self):
+        """
+        Yields the same videos as get_all_videos(), one dict at a time, parsing the response as it streams in.
+        Use this when you only need to loop over or count videos and don't want all of them in memory at once.
+        Requires ijson: pip install python-cloudflare-stream[stream]
+
+        Usage:
+        for video in client.iter_all_videos():
+            print(video['uid'])
+        """
+        if ijson is None:
+            raise ImportError("ijson is required to stream videos: pip install python-cloudflare-stream[stream]")
+
+        url = f"{self._base}/"
+        with self._session.get(url, stream=True, timeout=self._timeout) as response:
+            # An error response has "result": null, which would otherwise look like an account with no videos.
+            response.raise_for_status()
+            response.raw.decode_content = True  # Let urllib3 un-gzip the body for us
+            yield from ijson.items(response.raw, 'result.item', use_float=True)
+
     def list_signing_keys(self) -> dict:
         """
         Returns a list of your signing keys. Any key can sign for any video.
 
         Caveat: Listing your keys will not display your PEM or JWK again. Those are created and shown ONCE.
         """
-        response = requests.get(f"https://api.cloudflare.com/client/v4/accounts/{self.ACCOUNT_ID}/stream/keys", headers=self._request_headers)
-        data = response.json()
+        response = self._session.get(self._keys_url, timeout=self._timeout)
+        data = _decode(response)
         return data